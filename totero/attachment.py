@@ -7,6 +7,7 @@
 # Distributed under terms of the BSD 3-Clause license.
 
 """Attachment-related widgets."""
+from typing import Any as _Any
 from typing import Sequence as _Sequence
 from typing import Union as _Union
 from pathlib import Path as _Path
@@ -51,14 +52,22 @@ class AttachmentItem(_AttrMap):
     # register signals
     signals = ["done"]
 
+    # slots for the per-attachment attributes; cuts per-instance memory on large libraries
+    __slots__ = ("_path", "_txt")
+
     # default color tags in palette
     _norm_ctag = "atthmnt item normal"
     _focus_ctag = "atthmnt item focus"
 
+    # display prefix (an indented arrow) shared by all items
+    _prefix = "    \u2192 "
+
     def __init__(self, path: _Union[str, _Path], wrap: str = "clip"):
         """Constructor. See class' docstring."""
-        self._path = _Path(path).expanduser().resolve()
-        self._txt = _Text("    \u2192 "+str(self._path.name), wrap=wrap)
+        # not resolved here; resolving stats every path component, and `xdg_open` resolves the
+        # path anyway when the attachment is actually opened
+        self._path = _Path(path)
+        self._txt = _Text(f"{self._prefix}{self._path.name}", wrap=wrap)
         self._txt.ignore_focus = False
         self._txt._selectable = True
         super().__init__(self._txt, self._norm_ctag, self._focus_ctag)
@@ -111,14 +120,14 @@ class AttachmentSelectionPopUP(_AttrMap):
 
         # the cancel button
         button = _CancelButton()
-        _connect_signal(button, 'cancel', lambda button: self._emit("close"))
+        _connect_signal(button, 'cancel', self._on_child_close)
         last_row = _Columns([_Text(""), (10, button)], 1)
 
         # convert strings/paths to AttachmentItem list
         data = []
         for att in attachments:
             data.append(att if isinstance(att, AttachmentItem) else AttachmentItem(att))
-            _connect_signal(data[-1], 'done', lambda button: self._emit("close"))
+            _connect_signal(data[-1], 'done', self._on_child_close)
 
         super().__init__(
             _LineBox(
@@ -128,6 +137,19 @@ class AttachmentSelectionPopUP(_AttrMap):
             ), self._border_line_ctag
         )
 
+    def _on_child_close(self, widget: _Any):  # pylint: disable=unused-argument
+        """Forward a child's done/cancel signal as our own "close" signal.
+
+        A bound method instead of one fresh lambda per attachment: no closure is allocated per
+        item, and `urwid.disconnect_signal` can actually find the handler.
+
+        Parameters
+        ----------
+        widget : any
+            The child widget emitting the signal. Not used here.
+        """
+        self._emit("close")
+
     def keypress(self, size: _Sequence[int], key: str):  # pylint: disable=unused-argument
         """See the docstring of urwid.Widget.keypress."""
         if self._command_map[key] == "exit program":  # ignore exit command
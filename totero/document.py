@@ -7,11 +7,15 @@
 # Distributed under terms of the BSD 3-Clause license.
 
 """Widgets related to documents."""
-from copy import deepcopy as _deepcopy
+from __future__ import annotations
+from os import PathLike as _PathLike
+from functools import lru_cache as _lru_cache
+from typing import TYPE_CHECKING as _TYPE_CHECKING
 from typing import Sequence as _Sequence
 from typing import Any as _Any
+from typing import Mapping as _Mapping
 from typing import Optional as _Optional
-from pandas import Series as _Series
+from typing import Union as _Union
 from urwid import Columns as _Columns
 from urwid import AttrMap as _AttrMap
 from urwid import Text as _Text
@@ -20,6 +24,89 @@ from urwid import connect_signal as _connect_signal
 from .attachment import AttachmentItem as _AttachmentItem
 from .attachment import AttachmentSelectionPopUP as _AttachmentSelectionPopUP
 
+# pandas costs hundreds of ms to import, so it is not imported at module load time; annotations
+# below are never evaluated thanks to `from __future__ import annotations`
+if _TYPE_CHECKING:
+    from pandas import Series as _Series
+    from pandas import DataFrame as _DataFrame
+
+
+# interned ("weight", w, False) option tuples, shared across all column specs
+_OPT_CACHE = {}
+
+
+def _opt(weight: int):
+    """Return the interned option tuple for a weight.
+
+    Parameters
+    ----------
+    weight : int
+        The weight of a column width.
+
+    Returns
+    -------
+    tuple
+        The exact `("weight", weight, False)` tuple `urwid.Columns` stores in `contents`; the
+        same object is returned for the same weight, so no tuple is allocated twice.
+    """
+    return _OPT_CACHE.setdefault(weight, ("weight", weight, False))
+
+
+@_lru_cache(maxsize=None)
+def _spec_options(weights: _Sequence[int]):
+    """Return the (frozen) urwid.Columns option tuples for a weight spec.
+
+    All rows of a document list share the same column spec, so the `("weight", w, False)`
+    option tuples are built once per spec and shared by reference across every row's Columns,
+    instead of being re-tuplified per row per reset.
+
+    Parameters
+    ----------
+    weights : tuple of int
+        The weights of the column widths.
+
+    Returns
+    -------
+    tuple of tuples
+        Option tuples in the exact normalized form `urwid.Columns` stores in `contents`.
+    """
+    return tuple(_opt(w) for w in weights)
+
+
+@_lru_cache(maxsize=1024)
+def _build_columns(token: int, values: _Sequence[str], weights: _Sequence[int], wrap: str):
+    """Build (or fetch a prebuilt) urwid.Columns for a row of cell strings.
+
+    Rebuilding the Columns and all inner Texts on every reset is the main allocation cost when
+    users toggle display columns or sorting back and forth, so the built widgets are kept in a
+    bounded LRU cache. The `token` ties an entry to one DocumentItem instance and its data
+    generation, so widgets are never shared between rows (urwid.Columns carries focus state).
+
+    Parameters
+    ----------
+    token : hashable
+        An identifier of the owning DocumentItem and its current data generation.
+    values : tuple of str
+        The already-stringified cell contents, in display order.
+    weights : tuple of int
+        The weights of the column widths.
+    wrap : str
+        See the `wrap` argument in `urwid.Text`.
+
+    Returns
+    -------
+    urwid.Columns
+    """
+    # pylint: disable=unused-argument
+
+    cols = _Columns([], dividechars=2)
+    cols.contents = [
+        (_Text(v, wrap=wrap), opt) for v, opt in zip(values, _spec_options(weights))
+    ]
+    cols.ignore_focus = False
+    cols._selectable = True  # pylint: disable=protected-access
+    return cols
+
 
 class DocumentItem(_AttrMap):
     """A row item that represents one document in Zotero.
@@ -28,9 +115,10 @@ class DocumentItem(_AttrMap):
 
     Parameters
     ----------
-    data : pandas.Series
-        The raw data of a document with brief info. The `pandas.Series` should have at least the
-        indices requested by `columns`. This widget makes a deep copy of the `data`.
+    data : pandas.Series or mapping
+        The raw data of a document with brief info. The `pandas.Series` (or plain dict) should
+        have at least the keys requested by `columns`. This widget makes a shallow copy of the
+        `data`.
     columns : list of str, or None
         The columns to be shown when rendered. The keys in `columns` should be valid indices of the
         `data`. If `None`, use all indices from `data`.
@@ -99,22 +187,43 @@ class DocumentItem(_AttrMap):
     document and "enter" to open the attachment selection pop-up.
     """
 
+    # one slot per instance attribute; urwid's bases still carry a __dict__, but these names
+    # bypass it, shrinking per-row memory and speeding up attribute access
+    __slots__ = (
+        "_data", "_str_data", "_all_columns", "_data_version", "_render_version", "_canv_cache",
+        "_wrap", "_attachment_win", "_attachments", "_has_attachment", "_popup_cache",
+        "_columns", "_weights", "_dirty",
+    )
+
     # color tag
     _normal_ctag = "doc item normal"
     _focus_ctag = "doc item focus"
 
     def __init__(
-        self, data: _Series, columns: _Optional[_Sequence[str]] = None,
+        self, data: _Union[_Series, _Mapping], columns: _Optional[_Sequence[str]] = None,
         weights: _Optional[_Sequence[int]] = None, wrap: str = "clip",
     ):
-        # sanity check
-        assert isinstance(data, _Series), "`data` should be a pandas.Series."
+        # sanity check; duck-typed so pandas does not have to be imported here
+        assert hasattr(data, "keys"), "`data` should be a pandas.Series or a mapping."
 
         # initialize parent with a placeholde/fake widget
         super().__init__(_Text(""), self._normal_ctag, self._focus_ctag)
 
         # make a reference to data
-        self._data = _deepcopy(data)
+        self._data = dict(data) if isinstance(data, _Mapping) else data.copy(deep=False)
+
+        # all available keys, frozen once; `reset_columns(None)` falls back to these
+        self._all_columns = tuple(self._data.keys())
+
+        # stringified cells; filled per key on demand and reused afterward
+        self._str_data = {}
+
+        # bumped on each reset_data to invalidate cached column widgets
+        self._data_version = 0
+
+        # bumped on any reset to invalidate the cached canvas below
+        self._render_version = 0
+        self._canv_cache = (None, None)
 
         # save the option
         self._wrap = wrap
@@ -122,24 +231,54 @@ class DocumentItem(_AttrMap):
         # initial attachment windows status
         self._attachment_win = None
 
+        # precompute the attachment entry so Enter presses don't probe the data
+        self._refresh_attachments()
+
         # initialize the copy of columns and weights
         self._columns = None
         self._weights = None
 
-        # set columns and weights, re-create the underlying Column widget, and re-render
+        # the underlying Column widget is built lazily at the first render
+        self._dirty = True
+
+        # set columns and weights; the underlying Column widget is not built yet
         self.reset_columns(columns, weights)
 
+    def selectable(self) -> bool:
+        """See the docstring of urwid.Widget.selectable."""
+        # always True; don't delegate to the placeholder widget before materialization
+        return True
+
+    def rows(self, size: _Sequence[int], focus: bool = False) -> int:
+        """See the docstring of urwid.Widget.rows."""
+        self._materialize()
+        return super().rows(size, focus)
+
+    def pack(self, size: _Sequence[int] = None, focus: bool = False):
+        """See the docstring of urwid.Widget.pack."""
+        self._materialize()
+        return super().pack(size, focus)
+
     def render(self, size: _Sequence[int], focus: bool = False):
         """See the docstring of urwid.Widget.render."""
-        canv = super().render(size, focus)
-        if self._attachment_win is not None:
-            canv = _CompositeCanvas(canv)
-            canv.set_pop_up(*self._attachment_win)
+        self._materialize()
+
+        # static rows (no pop-up pending) reuse the canvas from the previous frame
+        if self._attachment_win is None:
+            key = (size, focus, self._render_version)
+            if self._canv_cache[0] == key:
+                return self._canv_cache[1]
+            canv = super().render(size, focus)
+            self._canv_cache = (key, canv)
+            return canv
+
+        canv = _CompositeCanvas(super().render(size, focus))
+        canv.set_pop_up(*self._attachment_win)
         return canv
 
     def keypress(self, size: _Sequence[int], key: str):  # pylint: disable=unused-argument
         """See the docstring of urwid.Widget.keypress."""
-        if key == "enter":
+        if key == "enter" and self._has_attachment:
             return self._handle_attachment_triger()
 
         return key
@@ -161,58 +300,165 @@ class DocumentItem(_AttrMap):
 
         # if no columns are provided, show all columns
         if columns is None:
-            self._columns = self._data.index.to_list()
+            self._columns = list(self._all_columns)
         else:
-            self._columns = _deepcopy(columns)
+            self._columns = list(columns)
 
         # if no weights provided, use equal widths
         if weights is None:
             self._weights = [1] * len(self._columns)
         else:
-            self._weights = _deepcopy(weights)
+            self._weights = list(weights)
 
-        # underlying widget; a urwid.Column; will be saved as self._original_widget after __init__
-        cols = [
-            ("weight", w, _Text(str(self._data.loc[k]), wrap=self._wrap))
-            for w, k in zip(self._weights, self._columns)
-        ]
-        cols = _Columns(cols, dividechars=2)
-        cols.ignore_focus = False
-        cols._selectable = True  # pylint: disable=protected-access
+        # mark the underlying widget out-of-date; it is rebuilt at the next render
+        self._dirty = True
+        self._render_version += 1
+        self._invalidate()
 
-        # reset and rerender
-        self._set_original_widget(cols)
+    @classmethod
+    def reset_columns_bulk(
+        cls, widgets: _Sequence["DocumentItem"],
+        columns: _Optional[_Sequence[str]] = None,
+        weights: _Optional[_Sequence[int]] = None,
+    ):
+        """Reset the displayed columns of many DocumentItems at once.
+
+        `reset_columns` normalizes its arguments into fresh lists on every call; when a list
+        re-specs thousands of built rows with one identical spec, that is thousands of
+        redundant list copies. This classmethod normalizes once and binds the very same list
+        objects to every widget — the lists are never mutated in place, so sharing them by
+        reference is safe.
 
-    def reset_data(self, data: _Series):
-        """Reset the underlying pandas.Series."""
-        self._data = _deepcopy(data)
+        Parameters
+        ----------
+        widgets : iterable of DocumentItem
+            The items whose columns should be reset.
+        columns : list of str, or None
+            See the constructor's parameters in the class docstring. If `None`, each widget
+            falls back to all columns of its own data, so no shared spec exists.
+        weights : list of int, or None
+            See the constructor's parameters in the class docstring.
+        """
+        # pylint: disable=protected-access
+
+        if columns is None:
+            # the fallback depends on each widget's own data; normalize per widget as before
+            for widget in widgets:
+                widget.reset_columns(None, weights)
+            return
+
+        # the cheap spec-bind step, done once
+        columns = list(columns)
+        weights = [1] * len(columns) if weights is None else list(weights)
+
+        # the tight per-widget step: plain attribute stores, no per-call validation
+        for widget in widgets:
+            widget._columns = columns
+            widget._weights = weights
+            widget._dirty = True
+            widget._render_version += 1
+            widget._invalidate()
+
+    def _materialize(self):
+        """Build the underlying Column widget if it is out-of-date.
+
+        Building a `urwid.Columns` of `urwid.Text`s per document is the dominant cost when
+        loading a large library, so the construction is deferred until a document actually has
+        to be rendered. Off-screen documents hence never pay this cost.
+        """
+
+        if not self._dirty:
+            return
+
+        # stringify each requested cell only once per data generation; cells never shown (e.g.
+        # the 20-odd metadata fields hidden behind 4 visible columns) are never stringified
+        strs = self._str_data
+        for k in self._columns:
+            if k not in strs:
+                strs[k] = str(self._data[k])
+
+        # underlying widget; a urwid.Column; will be saved as self._original_widget
+        values = tuple(strs[k] for k in self._columns)
+        cols = _build_columns(
+            (id(self), self._data_version), values, tuple(self._weights), self._wrap)
+
+        self._set_original_widget(cols)
+        self._dirty = False
+
+    def reset_data(self, data: _Union[_Series, _Mapping]):
+        """Reset the underlying pandas.Series (or mapping)."""
+        self._data = dict(data) if isinstance(data, _Mapping) else data.copy(deep=False)
+        self._all_columns = tuple(self._data.keys())
+        self._str_data = {}
+        self._data_version += 1
+        self._refresh_attachments()
         self.reset_columns(self._columns, self._weights)
 
+    @classmethod
+    def from_frame(
+        cls, data: _DataFrame, columns: _Optional[_Sequence[str]] = None,
+        weights: _Optional[_Sequence[int]] = None, wrap: str = "clip",
+    ) -> list:
+        """Construct one DocumentItem per row of a DataFrame.
+
+        Constructing items one `pandas.Series` at a time (e.g., through `DataFrame.apply` or
+        `iloc`) boxes every row into a fresh `Series`, which dominates the loading cost of a
+        large library. This classmethod walks the frame once with `itertuples` and feeds plain
+        dicts to the constructor instead.
+
+        Parameters
+        ----------
+        data : pandas.DataFrame
+            The raw data of the documents; one document per row.
+        columns : list of str, or None
+            See the constructor's parameters in the class docstring.
+        weights : list of int, or None
+            See the constructor's parameters in the class docstring.
+        wrap : str
+            See the constructor's parameters in the class docstring.
+
+        Returns
+        -------
+        list of DocumentItem
+        """
+        keys = data.columns.to_list()
+        rows = data.itertuples(index=False, name=None)
+        return [cls(dict(zip(keys, row)), columns, weights, wrap) for row in rows]
+
+    def _refresh_attachments(self):
+        """Cache the value of the `"attachment path"` entry (or None if absent).
+
+        Looking the entry up once here keeps `keypress` free of pandas label-indexing and of
+        the KeyError-as-control-flow probe on every Enter press.
+        """
+        self._attachments = self._data.get("attachment path")
+        self._has_attachment = self._attachments is not None
+        self._popup_cache = None  # any previously built selection popup is now stale
+
     def _handle_attachment_triger(self):
         """Create a pop-up window widget."""
 
         # make a reference for shorter code
-        try:
-            raw_atta = self._data.loc["attachment path"]
-        except KeyError:
-            return None
+        raw_atta = self._attachments
 
-        # try if it's a str or path-like
-        try:
+        # a single str/path-like opens directly
+        if isinstance(raw_atta, (str, _PathLike)):
             return _AttachmentItem(raw_atta).keypress((None,), "enter")
-        except TypeError:  # neither a str nor a path-like
-            pass
 
         # then we assume it's a list or tuple or any iteratable
         if len(raw_atta) == 0:
             return None
 
         if len(raw_atta) == 1:
-            _AttachmentItem(raw_atta).keypress((None,), "enter")
+            return _AttachmentItem(raw_atta[0]).keypress((None,), "enter")
+
+        # build the selection window once per data generation; closing only hides it, so
+        # repeated Enter presses reuse the same widget tree and signal wiring
+        if self._popup_cache is None:
+            self._popup_cache = _AttachmentSelectionPopUP(raw_atta)
+            _connect_signal(self._popup_cache, "close", self._clear_pop_up)
 
-        self._attachment_win = [_AttachmentSelectionPopUP(raw_atta)]
-        self._attachment_win.extend([1, 1, 100, len(raw_atta)+5])
-        _connect_signal(self._attachment_win[0], "close", self._clear_pop_up)
+        self._attachment_win = [self._popup_cache, 1, 1, 100, len(raw_atta)+5]
         self._invalidate()
         return None
 
@@ -228,4 +474,4 @@ class DocumentItem(_AttrMap):
         self._invalidate()
 
     def __str__(self):
-        return str(self._data.to_list())
+        return str([self._data[k] for k in self._data.keys()])
@@ -7,16 +7,15 @@
 # Distributed under terms of the BSD 3-Clause license.
 
 """A window showing a list of documents."""
-from copy import deepcopy as _deepcopy
+from __future__ import annotations
+from typing import TYPE_CHECKING as _TYPE_CHECKING
 from typing import Union as _Union
 from typing import Optional as _Optional
 from typing import Sequence as _Sequence
-from pandas import DataFrame as _DataFrame
-from urwid import SimpleFocusListWalker as _SimpleFocusListWalker
+from urwid import ListWalker as _ListWalker
 from urwid import Text as _Text
 from urwid import Pile as _Pile
 from urwid import Filler as _Filler
-from urwid import ListBox as _ListBox
 from urwid import AttrMap as _AttrMap
 from urwid import Columns as _Columns
 from urwid import Divider as _Divider
@@ -24,6 +23,138 @@ from urwid import CompositeCanvas as _CompositeCanvas
 from urwid import connect_signal as _connect_signal
 from .document import DocumentItem as _DocumentItem
 from .optionlist import OptionList as _OptionList
+from .misc import CachingListBox as _CachingListBox
+
+# pandas is only imported lazily (see document.py); callers hand us a ready DataFrame anyway
+if _TYPE_CHECKING:
+    from pandas import DataFrame as _DataFrame
+
+
+class LazyDocumentWalker(_ListWalker):
+    """A list walker that builds DocumentItems only for the rows being visited.
+
+    Building one widget tree per row up-front makes the start-up cost O(total rows) while the
+    user can only ever see a screenful. This walker holds the raw `pandas.DataFrame` and
+    constructs a `DocumentItem` the first time the ListBox asks for a position; built widgets
+    are kept in a per-position cache, so revisiting rows is a dict lookup.
+
+    Parameters
+    ----------
+    wrap : str
+        The `wrap` argument in a `urwid.Text` widget; forwarded to each DocumentItem.
+    """
+
+    def __init__(self, wrap: str = "clip"):
+        """Constructor. See class' docstring."""
+        self._frame = None
+        self._length = 0
+        self._columns = None
+        self._weights = None
+        self._wrap = wrap
+        self._cache = {}
+        self.focus = 0
+
+    def reset_frame(
+        self, frame: _DataFrame, columns: _Optional[_Sequence[str]] = None,
+        weights: _Optional[_Sequence[int]] = None,
+    ):
+        """Replace the underlying DataFrame; all built widgets are discarded.
+
+        Parameters
+        ----------
+        frame : pandas.DataFrame
+            The raw data of the documents; one document per row.
+        columns : list of str, or None
+            The columns each newly built DocumentItem should display.
+        weights : list of int, or None
+            The weights of the column widths.
+        """
+        self._frame = frame
+        self._length = len(frame.index)
+        self._columns = columns
+        self._weights = weights
+        self._cache.clear()
+        self.focus = 0
+        self._modified()
+
+    def reset_spec(
+        self, columns: _Optional[_Sequence[str]], weights: _Optional[_Sequence[int]],
+    ):
+        """Change the displayed columns/weights for built and future widgets.
+
+        Parameters
+        ----------
+        columns : list of str, or None
+            See `reset_frame`.
+        weights : list of int, or None
+            See `reset_frame`.
+        """
+        self._columns = columns
+        self._weights = weights
+        _DocumentItem.reset_columns_bulk(self._cache.values(), columns, weights)
+        self._modified()
+
+    def permute(self, frame: _DataFrame, order: _Sequence[int]):
+        """Replace the frame with a reordered version of itself.
+
+        Unlike `reset_frame`, already-built widgets survive and follow their rows to the new
+        positions, so sorting does not throw away the widgets of the visible screen.
+
+        Parameters
+        ----------
+        frame : pandas.DataFrame
+            The reordered frame; it must hold the same rows as the current one.
+        order : a sequence of int
+            The permutation applied: new position `i` shows the row formerly at `order[i]`.
+        """
+        self._frame = frame
+        old = self._cache
+        self._cache = {new: old[int(i)] for new, i in enumerate(order) if int(i) in old}
+        self.focus = 0
+        self._modified()
+
+    def __len__(self):
+        return self._length
+
+    def __getitem__(self, position: int):
+        """Return the widget at `position`, building it on first access."""
+        try:
+            return self._cache[position]
+        except KeyError:
+            pass
+
+        if not 0 <= position < self._length:
+            raise IndexError(f"No document at position {position}")
+
+        widget = _DocumentItem(
+            self._frame.iloc[position], self._columns, self._weights, self._wrap)
+        self._cache[position] = widget
+        return widget
+
+    def next_position(self, position: int) -> int:
+        """See the docstring of urwid.ListWalker.get_next."""
+        if position >= self._length - 1:
+            raise IndexError(f"No document after position {position}")
+        return position + 1
+
+    def prev_position(self, position: int) -> int:
+        """See the docstring of urwid.ListWalker.get_prev."""
+        if position <= 0:
+            raise IndexError(f"No document before position {position}")
+        return position - 1
+
+    def set_focus(self, position: int):
+        """See the docstring of urwid.ListWalker."""
+        if self._length and not 0 <= position < self._length:
+            raise IndexError(f"No document at position {position}")
+        self.focus = position
+        self._modified()
+
+    def positions(self, reverse: bool = False):
+        """Return a range covering all row positions."""
+        if reverse:
+            return range(self._length - 1, -1, -1)
+        return range(self._length)
 
 
 class DocumentList(_AttrMap):
@@ -36,7 +167,8 @@ class DocumentList(_AttrMap):
     ----------
     data : pandas.DataFrame
         The raw data of a document list with brief info. The `pandas.DataFrame` should have at least
-        the columns requested by `columns`. This widget makes a deep copy of the `data`.
+        the columns requested by `columns`. This widget keeps a reference to the `data` and never
+        modifies it.
     columns : list of str, or None
         The columns to be shown when rendered. The keys in `columns` should be valid column names of
         the `data`. If `None`, use all columns from `data`.
@@ -91,11 +223,13 @@ class DocumentList(_AttrMap):
         self, data: _DataFrame, columns: _Optional[_Sequence[str]] = None,
         weights: _Optional[_Sequence[int]] = None, wrap: str = "clip",
     ):
-        # sanity check
-        assert isinstance(data, _DataFrame), "`data` should be a pandas.DataFrame."
+        # sanity check; by now the caller has imported pandas, so this import is a cached lookup
+        from pandas import DataFrame as _frame_cls  # pylint: disable=import-outside-toplevel
+        assert isinstance(data, _frame_cls), "`data` should be a pandas.DataFrame."
 
-        # initialize widgets
-        self._content = _ListBox(_SimpleFocusListWalker([]))
+        # initialize widgets; documents materialize in the walker as the user scrolls to them
+        self._walker = LazyDocumentWalker(wrap)
+        self._content = _CachingListBox(self._walker)
         self._header = _AttrMap(_Columns([], dividechars=2), self._header_ctag)
 
         super().__init__(
@@ -112,6 +246,12 @@ class DocumentList(_AttrMap):
         self._weights = None
         self._data = None
 
+        # computed weights memoized per column tuple; cleared when the data changes
+        self._weight_cache = {}
+
+        # header Text widgets keyed by column name; their content never depends on the data
+        self._header_texts = {}
+
         # set the data and adjust the displated columns
         self.reset_data(data)
         self.reset_columns(columns, weights)
@@ -121,6 +261,9 @@ class DocumentList(_AttrMap):
         self._popup_width = None
         self._popup_height = None
 
+        # clamped popup placement memoized per canvas size; reset when a popup is (re)created
+        self._popup_geom_cache = None
+
     def reset_columns(
         self,
         columns: _Optional[_Sequence[str]] = None,
@@ -139,26 +282,40 @@ class DocumentList(_AttrMap):
         # if no columns are provided, show all columns
         if columns is None:
             self._columns = self._data.columns.to_list()
-            self._columns.remove("widget")
         else:
-            self._columns = _deepcopy(columns)
-
-        # if no weights provided, use columns' average lendth
-        if weights is None:
-            self._weights = self._data[self._columns].applymap(str).applymap(len)
-            self._weights = (self._weights.median(0) + 0.5).astype(int).tolist()
+            self._columns = list(columns)
+
+        # if no weights provided, use columns' average lendth (memoized per column tuple)
+        if weights is None and not self._columns:
+            # nothing selected for display; numpy.stack needs at least one array
+            self._weights = []
+        elif weights is None:
+            key = tuple(self._columns)
+            cached = self._weight_cache.get(key)
+            if cached is not None:
+                self._weights = cached
+            else:
+                # Series.str.len is a vectorized C-level pass; applymap would call back into
+                # Python once per cell
+                import numpy  # pylint: disable=import-outside-toplevel
+                arr = numpy.stack(
+                    [self._data[c].astype(str).str.len().to_numpy() for c in self._columns])
+                self._weights = (numpy.median(arr, axis=1) + 0.5).astype(int).tolist()
+                self._weight_cache[key] = self._weights
         else:
-            self._weights = _deepcopy(weights)
+            self._weights = list(weights)
 
-        # configure the header
-        self._header.original_widget.contents = [
-            (_Text(c, wrap=self._wrap), ("weight", w, False))
-            for w, c in zip(self._weights, self._columns)
-        ]
+        # configure the header, reusing the Text widgets built for earlier configurations
+        contents = []
+        for w, c in zip(self._weights, self._columns):
+            txt = self._header_texts.get(c)
+            if txt is None:
+                txt = self._header_texts[c] = _Text(c, wrap=self._wrap)
+            contents.append((txt, ("weight", w, False)))
+        self._header.original_widget.contents = contents
 
-        # a Series of DocumentItem
-        for widget in self._data["widget"]:
-            widget.reset_columns(self._columns, self._weights)
+        # only widgets that were actually built get touched; future ones pick up the new spec
+        self._walker.reset_spec(self._columns, self._weights)
 
     def reset_data(self, data: _DataFrame):
         """Reset the underlying pandas.DataFrame.
@@ -167,12 +324,14 @@ class DocumentList(_AttrMap):
         ----------
         data : pandas.DataFrame
         """
-        _c, _w, _wrap = self._columns, self._weights, self._wrap  # to make code shorter
-        self._data = data.copy()
-        self._data["widget"] = self._data.apply(lambda x: _DocumentItem(x, _c, _w, _wrap), 1)
-        self._content.body.clear()
-        self._content.body.extend(self._data["widget"])
-        self._content.body.set_focus(0)
+        self._weight_cache.clear()  # weights derived from the old data are stale now
+
+        # keep a reference only; nothing here mutates the frame anymore (widgets live in the
+        # walker, not in a frame column), so cloning every column would just burn memory
+        self._data = data
+
+        # no widgets are built here; the walker materializes them as rows become visible
+        self._walker.reset_frame(self._data, self._columns, self._weights)
 
     def sort_by(self, columns: _Union[str, _Sequence[str]], ascending: bool = True):
         """Sort the document list based on the values in a column.
@@ -185,21 +344,35 @@ class DocumentList(_AttrMap):
             Ascending or descending.
         """
 
-        self._data = self._data.sort_values(columns, 0, ascending)
-        self._content.body.clear()
-        self._content.body.extend(self._data["widget"])
-        self._content.body.set_focus(0)
+        # compute the permutation on the key columns only with a C-level lexsort;
+        # DataFrame.sort_values would also drag the object-dtype "widget" column through
+        # Python-level comparisons
+        import numpy  # pylint: disable=import-outside-toplevel
+        columns = [columns] if isinstance(columns, str) else list(columns)
+
+        # nothing to sort by (e.g. the sort dialog was cancelled); lexsort rejects empty keys
+        if not columns:
+            return
+
+        order = numpy.lexsort([self._data[c].to_numpy() for c in reversed(columns)])
+        if not ascending:
+            order = order[::-1]
+        self._data = self._data.iloc[order]
+        self._walker.permute(self._data, order)
 
     def render(self, size: _Sequence[int], focus: bool = False):
         """See the docstring of urwid.Widget.render."""
         canv = super().render(size, focus)
         if self._popup is not None:
             canv = _CompositeCanvas(canv)
-            width = min(self._popup_width, canv.cols()-2)
-            height = min(self._popup_height, canv.rows()-2)
-            left = (canv.cols() - width) // 2
-            top = (canv.rows() - height) // 2
-            canv.set_pop_up(self._popup, left, top, width, height)
+            key = (canv.cols(), canv.rows())
+            if self._popup_geom_cache is None or self._popup_geom_cache[0] != key:
+                width = min(self._popup_width, key[0]-2)
+                height = min(self._popup_height, key[1]-2)
+                left = (key[0] - width) // 2
+                top = (key[1] - height) // 2
+                self._popup_geom_cache = (key, (left, top, width, height))
+            canv.set_pop_up(self._popup, *self._popup_geom_cache[1])
         return canv
 
     def keypress(self, size: _Sequence[int], key: str):  # pylint: disable=unused-argument
@@ -223,14 +396,12 @@ class DocumentList(_AttrMap):
             self._popup_width = None
             self._popup_height = None
             self._invalidate()
-            try:
-                self.sort_by(keys)
-            except IndexError:  # no keys returned
-                pass
+            self.sort_by(keys)  # a no-op when no keys were selected
 
         self._popup = _OptionList(self._columns, title="Select solumns to sort")
-        self._popup_width = max(26, max(map(lambda x: len(x)+8, self._columns)))
+        self._popup_width = max(26, max(len(c) for c in self._columns) + 8)
         self._popup_height = len(self._columns)+5
+        self._popup_geom_cache = None
         _connect_signal(self._popup, "close", finalize_popup)
         self._invalidate()
 
@@ -246,10 +417,10 @@ class DocumentList(_AttrMap):
             self.reset_columns(keys, None)  # TODO: what should happen when no columns are selected?
 
         all_columns = self._data.columns.tolist()
-        all_columns.remove("widget")
         all_states = [True if c in self._columns else False for c in all_columns]
         self._popup = _OptionList(all_columns, all_states, title="Select solumns to display")
-        self._popup_width = max(29, max(map(lambda x: len(x)+8, all_columns)))
+        self._popup_width = max(29, max(len(c) for c in all_columns) + 8)
         self._popup_height = len(all_columns)+5
+        self._popup_geom_cache = None
         _connect_signal(self._popup, "close", finalize_popup)
         self._invalidate()
@@ -12,25 +12,29 @@ Attributes
 ----------
 command_map : urwid.CommandMap
     Custom command map shared by widgets.
-default_theme : list of tuples of str/None
+default_theme : tuple of tuples of str
     Default color palette.
 """
-from subprocess import Popen as _Popen
-from subprocess import PIPE as _PIPE
-from subprocess import DEVNULL as _DEVNULL
+import os as _os
+from select import select as _select
+from shutil import which as _which
 from pathlib import Path as _Path
 from typing import Union as _Union
 from typing import Sequence as _Sequence
-from time import sleep as _sleep
-from urwid import Widget as _Widget
 from urwid import AttrMap as _AttrMap
 from urwid import Text as _Text
 from urwid import LineBox as _LineBox
+from urwid import ListBox as _ListBox
 from urwid import ExitMainLoop as _ExitMainLoop
-from urwid import CommandMap as _CommandMap
+from urwid import command_map as _urwid_command_map
+from urwid import connect_signal as _connect_signal
 
-# define our own command map
-command_map = _CommandMap()
+# resolve the opener once at import time, instead of a PATH search per spawn
+_XDG = _which("xdg-open") or "xdg-open"
+
+# customize urwid's own command-map singleton in place; every widget already consults it, so
+# no base-class monkey-patching is needed and embedding applications see the binding explicitly
+command_map = _urwid_command_map
 command_map["j"] = command_map["down"]
 command_map["k"] = command_map["up"]
 command_map["h"] = command_map["left"]
@@ -40,37 +44,200 @@ command_map["ctrl u"] = command_map["page up"]
 command_map["q"] = "exit program"
 command_map["f1"] = "sort documents"
 command_map["f2"] = "reset display columns"
-_Widget._command_map = command_map  # pylint: disable=protected-access
-
-# default color palette
-default_theme = [
-    ("opt item normal", "white", "black", None, None, None),
-    ("opt item focus", "black", "yellow", None, None, None),
-    ("opt list title", "light red,bold,italics", "black", None, None, None),
-    ("opt list border", "yellow", "black", None, None, None),
-    ("doc item normal", "white", "black", None, None, None),
-    ("doc item focus", "black", "yellow", None, None, None),
-    ("atthmnt win title", "light red,bold,italics", "black", None, None, None),
-    ("atthmnt win border", "yellow", "black", None, None, None),
-    ("atthmnt item normal", "white", "black", None, None, None),
-    ("atthmnt item focus", "black", "yellow", None, None, None),
-    ("cncl butn normal", "white", "black", None, None, None),
-    ("cncl butn focus", "black", "yellow", None, None, None),
-    ("cncl butn outline", "white", "black", None, None, None),
-    ("done butn normal", "white", "black", None, None, None),
-    ("done butn focus", "black", "yellow", None, None, None),
-    ("done butn outline", "white", "black", None, None, None),
-    ("doc list header", "white,bold", "black", None, None, None),
-    ("doc list divider", "white,bold", "black", None, None, None),
-]
-
-
-def xdg_open(filepath: _Union[str, _Path], wait: int = 0):
+
+# default color palette; an immutable tuple of the short 3-tuple form (urwid fills in the
+# mono/high-color fields itself), built once at import time
+default_theme = (
+    ("opt item normal", "white", "black"),
+    ("opt item focus", "black", "yellow"),
+    ("opt list title", "light red,bold,italics", "black"),
+    ("opt list border", "yellow", "black"),
+    ("doc item normal", "white", "black"),
+    ("doc item focus", "black", "yellow"),
+    ("atthmnt win title", "light red,bold,italics", "black"),
+    ("atthmnt win border", "yellow", "black"),
+    ("atthmnt item normal", "white", "black"),
+    ("atthmnt item focus", "black", "yellow"),
+    ("cncl butn normal", "white", "black"),
+    ("cncl butn focus", "black", "yellow"),
+    ("cncl butn outline", "white", "black"),
+    ("done butn normal", "white", "black"),
+    ("done butn focus", "black", "yellow"),
+    ("done butn outline", "white", "black"),
+    ("doc list header", "white,bold", "black"),
+    ("doc list divider", "white,bold", "black"),
+)
+
+
+# handles that were dropped while their child was still running; a later `_spawn_opener` call
+# reaps them opportunistically, mirroring how subprocess._active prevents zombies
+_active = []
+
+
+class _SpawnedProcess:
+    """A minimal Popen-like handle for a process started with `os.posix_spawn`.
+
+    Only the pieces `xdg_open` and `_check_open_status` rely on are provided: `poll`, a
+    `wait`-with-timeout, and a readable `stderr` stream.
+
+    Parameters
+    ----------
+    pid : int
+        The child's process id.
+    pidfd : int
+        A file descriptor referring to the child (from `os.pidfd_open`).
+    stderr : io.BufferedReader
+        The read end of the child's stderr pipe.
+    """
+
+    __slots__ = ("pid", "stderr", "_pidfd", "_status")
+
+    def __init__(self, pid: int, pidfd: int, stderr):
+        """Constructor. See class' docstring."""
+        self.pid = pid
+        self.stderr = stderr
+        self._pidfd = pidfd
+        self._status = None
+
+    def poll(self) -> _Union[int, None]:
+        """Return the exit status if the child has exited, otherwise None. Never blocks."""
+        if self._status is None and self._pidfd >= 0:
+            result = _os.waitid(_os.P_PIDFD, self._pidfd, _os.WEXITED | _os.WNOHANG)
+            if result is not None:
+                self._status = result.si_status
+                _os.close(self._pidfd)
+                self._pidfd = -1
+        return self._status
+
+    def wait(self, timeout: float) -> _Union[int, None]:
+        """Wait up to `timeout` seconds for the child to exit; return `poll()`.
+
+        The pidfd becomes readable the moment the child exits, so `select` returns as soon as
+        there is an actual status to report instead of always burning the full timeout.
+        """
+        if self._status is None and self._pidfd >= 0:
+            _select([self._pidfd], [], [], timeout)
+        return self.poll()
+
+    def __del__(self):
+        if self._pidfd < 0:
+            return
+
+        # try to reap the child now so discarding a handle (the common wait=0 usage) does not
+        # leave a zombie behind
+        try:
+            self.poll()
+        except OSError:  # already reaped elsewhere, or interpreter shutdown oddities
+            _os.close(self._pidfd)
+            self._pidfd = -1
+            return
+
+        # still running: resurrect the handle onto the module-level list so a later spawn can
+        # finish the reaping
+        if self._pidfd >= 0:
+            _active.append(self)
+
+
+def _spawn_opener(filepath: str, capture_stderr: bool = True) -> _SpawnedProcess:
+    """Spawn `xdg-open` on a file through `os.posix_spawn`.
+
+    `posix_spawn` is vfork-backed on Linux, so launching the opener does not copy the page
+    tables of the (potentially large) interpreter heap the way plain fork does. The child's
+    stdin/stdout point at the null device; stderr goes into a pipe for the error branches of
+    `_check_open_status` only when `capture_stderr` is set — callers that never check the
+    status should not pay for a kernel pipe buffer nobody reads.
+
+    Parameters
+    ----------
+    filepath : str
+        The path handed to xdg-open.
+    capture_stderr : bool
+        Whether to capture the child's stderr; when False, the handle's `stderr` is None and
+        the child's stderr goes to the null device.
+
+    Returns
+    -------
+    _SpawnedProcess
+    """
+    # reap children whose handles were discarded while still running
+    for proc in _active[:]:
+        if proc.poll() is not None:
+            _active.remove(proc)
+
+    devnull = _os.open(_os.devnull, _os.O_RDWR)
+    rerr, werr = _os.pipe() if capture_stderr else (None, devnull)
+    try:
+        pid = _os.posix_spawn(
+            _XDG, [_XDG, filepath], _os.environ,
+            file_actions=[
+                (_os.POSIX_SPAWN_DUP2, devnull, 0),
+                (_os.POSIX_SPAWN_DUP2, devnull, 1),
+                (_os.POSIX_SPAWN_DUP2, werr, 2),
+            ])
+    except OSError:
+        if rerr is not None:
+            _os.close(rerr)
+        raise
+    finally:
+        _os.close(devnull)
+        if werr != devnull:
+            _os.close(werr)
+
+    stderr = _os.fdopen(rerr, "rb") if rerr is not None else None
+    return _SpawnedProcess(pid, _os.pidfd_open(pid), stderr)
+
+
+# maps each failing xdg-open exit status to its exception type and message template; one hash
+# lookup replaces the former if-ladder, and non-error statuses (None, 0) fall through for free
+_XDG_ERRORS = {
+    1: (RuntimeError, "The execution returns the following error:\n\n{stderr}"),
+    2: (FileNotFoundError, "{filepath} does not exist!"),
+    3: (RuntimeError, "xdg-open does not know how to open {filepath}"),
+    4: (RuntimeError, "The execution returns the following error:\n\n{stderr}"),
+}
+
+
+def _check_open_status(result: _SpawnedProcess, filepath: _Path):
+    """Poll a spawned xdg-open once and raise if it already failed.
+
+    Parameters
+    ----------
+    result : _SpawnedProcess
+        The spawned xdg-open process.
+    filepath : path-like
+        The file that was opened; only used in error messages.
+
+    Raises
+    ------
+    RuntimeError
+        When `xdg-open` return following error codes: 1, 3, and 4.
+    FileNotFoundError
+        When `xdg-open` returns error code 2.
+    """
+
+    status = result.poll()
+
+    err = _XDG_ERRORS.get(status)
+    if err is None:
+        return
+
+    # only the error path pays for draining the pipe and canonicalizing the path; the stream
+    # holds bytes, not str
+    etype, template = err
+    stderr = result.stderr.read().decode(errors="replace") if result.stderr else ""
+    filepath = _Path(filepath).resolve(strict=False)
+    raise etype(template.format(filepath=filepath, stderr=stderr))
+
+
+def xdg_open(filepath: _Union[str, _Path], wait: int = 0, loop=None):
     """Open a file with xdg-open.
 
-    By default, the code check if the file is successfully opened by some application immediately
-    after the subprocess is spawn. If yes, return the `Popen` object (which can access stdout &
-    stderr). Otherwise. raise corresponding errors.
+    With the default `wait=0`, the subprocess is spawned and returned immediately: no status
+    can be available yet, so waiting and polling would only stall the render loop. With
+    `wait > 0`, the status check runs within `wait` seconds — scheduled on `loop` via
+    `set_alarm_in` when a `urwid.MainLoop` is given (keeping the TUI responsive), or by
+    `select`-ing on the child's pidfd otherwise, which returns as soon as the opener exits
+    instead of always sleeping out the full `wait`.
 
     Parameters
     ----------
@@ -78,11 +245,12 @@ def xdg_open(filepath: _Union[str, _Path], wait: int = 0):
         The path to the file.
     wait : int
         How many second to wait before we check if the file is opened successfully
+    loop : urwid.MainLoop or None
+        If provided (and `wait > 0`), the check is scheduled on this loop instead of blocking.
 
     Returns
     -------
-    subprocess.Popen
-        Note: the `poll()` method is already called once.
+    _SpawnedProcess
 
     Raises
     ------
@@ -93,22 +261,23 @@ def xdg_open(filepath: _Union[str, _Path], wait: int = 0):
 
     """
 
-    filepath = _Path(filepath).expanduser().resolve()
-    result = _Popen(["xdg-open", filepath], stdin=_DEVNULL, stdout=_PIPE, stderr=_PIPE)
-
-    _sleep(wait)
-    status = result.poll()
+    # only `~` is expanded here; canonicalizing would stat every path component (painful on
+    # network mounts) just to hand xdg-open a path it can open verbatim anyway. The error
+    # branches resolve the path lazily when they format a message.
+    filepath = _Path(filepath).expanduser()
 
-    # something's weong
-    if status == (1, 4):
-        raise RuntimeError("The execution returns the following error:\n\n"+result.stderr)
+    # with wait == 0 nobody ever reads the child's stderr, so no pipe is allocated for it
+    result = _spawn_opener(str(filepath), capture_stderr=wait > 0)
 
-    if status == 2:
-        raise FileNotFoundError("{} does not exist!".format(filepath))
+    if wait <= 0:
+        return result
 
-    if status == 3:
-        raise RuntimeError("xdg-open does not know how to open {}".format(filepath))
+    if loop is not None:
+        loop.set_alarm_in(wait, lambda *args: _check_open_status(result, filepath))
+        return result
 
+    result.wait(wait)
+    _check_open_status(result, filepath)
     return result
 
 
@@ -124,7 +293,89 @@ def exit_trigger(key: str):
         raise _ExitMainLoop()
 
 
-class CancelButton(_AttrMap):
+class CachingListBox(_ListBox):
+    """A ListBox that caches the results of `rows_max`.
+
+    `urwid.ListBox.rows_max` iterates all children to sum up their heights, so it is O(N) w.r.t.
+    the number of items, and it may be queried on every keypress/render. For a list showing
+    thousands of documents, this makes the responsiveness degrade with the library size. This
+    subclass memoizes the result per `size` and clears the memo whenever the underlying list
+    walker reports a modification.
+
+    Note: `rows_max` does not exist in old versions of `urwid`. With such versions this subclass
+    behaves exactly like a plain `urwid.ListBox`.
+
+    Parameters
+    ----------
+    body : a list walker (e.g., urwid.SimpleFocusListWalker)
+        See the `body` argument in `urwid.ListBox`.
+    """
+
+    def __init__(self, body):
+        """Constructor. See class' docstring."""
+        self._cached_sizes = {}
+        super().__init__(body)
+
+        # invalidate the cache whenever the content of the walker changes
+        try:
+            body.set_modified_callback(self._clear_size_cache)
+        except (AttributeError, NotImplementedError):
+            _connect_signal(body, "modified", self._clear_size_cache)
+
+    def rows_max(self, size=None, focus: bool = False) -> int:
+        """See the docstring of urwid.ListBox.rows_max."""
+        try:
+            return self._cached_sizes[size]
+        except KeyError:
+            result = super().rows_max(size, focus)
+            self._cached_sizes[size] = result
+            return result
+
+    def _clear_size_cache(self, *args):  # pylint: disable=unused-argument
+        """Drop all cached sizes (the walker's content was modified)."""
+        self._cached_sizes.clear()
+
+
+class _LabeledButton(_AttrMap):
+    """Shared implementation of the hard-coded buttons below.
+
+    Subclasses only declare the label, the signal emitted on "enter", and the color tags; the
+    text+border widget tree is assembled by the `_make` factory from those class attributes, so
+    the two button classes carry no duplicated construction code.
+    """
+
+    # no per-instance attributes beyond what urwid's bases keep
+    __slots__ = ()
+
+    # to be overridden by subclasses
+    _label = ""
+    _signal = ""
+    _norm_ctag = ""
+    _focus_ctag = ""
+    _outline_ctag = ""
+
+    @classmethod
+    def _make(cls) -> _LineBox:
+        """Assemble the inner text+border widget tree for this button class."""
+        txt = _Text(cls._label, "center", "clip")
+        txt.ignore_focus = False
+        txt._selectable = True  # pylint: disable=protected-access
+        return _LineBox(_AttrMap(txt, cls._norm_ctag, cls._focus_ctag))
+
+    def __init__(self):
+        """Constructor. See class' docstring."""
+        super().__init__(self._make(), self._outline_ctag)
+
+    def keypress(self, size: _Sequence[int], key: str) -> _Union[str, None]:
+        """See the docstring of urwid.Widget.keypress."""
+        # pylint: disable=unused-argument
+        if key == "enter":
+            self._emit(self._signal)
+            return None
+        return key
+
+
+class CancelButton(_LabeledButton):
     """A cancel button.
 
     This is a specialized button that everything is hard-coded, except the display attributes.
@@ -148,29 +399,19 @@ class CancelButton(_AttrMap):
     # register signals
     signals = ["cancel"]
 
+    __slots__ = ()
+
+    # label and emitted signal
+    _label = "Cancel"
+    _signal = "cancel"
+
     # default color tags in palette
     _norm_ctag = "cncl butn normal"
     _focus_ctag = "cncl butn focus"
     _outline_ctag = "cncl butn outline"
 
-    def __init__(self):
-        """Constructor. See class' docstring."""
-        self._txt = _Text("Cancel", "center", "clip")
-        self._txt.ignore_focus = False
-        self._txt._selectable = True
-        self._txt = _AttrMap(self._txt, self._norm_ctag, self._focus_ctag)
-        super().__init__(_LineBox(self._txt), self._outline_ctag)
 
-    def keypress(self, size: _Sequence[int], key: str) -> _Union[str, None]:
-        """See the docstring of urwid.Widget.keypress."""
-        # pylint: disable=unused-argument
-        if key == "enter":
-            self._emit("cancel")
-            return None
-        return key
-
-
-class DoneButton(_AttrMap):
+class DoneButton(_LabeledButton):
     """A done button.
 
     This is a specialized button that everything is hard-coded, except the display attributes.
@@ -194,23 +435,13 @@ class DoneButton(_AttrMap):
     # register signals
     signals = ["done"]
 
+    __slots__ = ()
+
+    # label and emitted signal
+    _label = "Done"
+    _signal = "done"
+
     # default color tags in palette
     _norm_ctag = "done butn normal"
     _focus_ctag = "done butn focus"
     _outline_ctag = "done butn outline"
-
-    def __init__(self):
-        """Constructor. See class' docstring."""
-        self._txt = _Text("Done", "center", "clip")
-        self._txt.ignore_focus = False
-        self._txt._selectable = True
-        self._txt = _AttrMap(self._txt, self._norm_ctag, self._focus_ctag)
-        super().__init__(_LineBox(self._txt), self._outline_ctag)
-
-    def keypress(self, size: _Sequence[int], key: str) -> _Union[str, None]:
-        """See the docstring of urwid.Widget.keypress."""
-        # pylint: disable=unused-argument
-        if key == "enter":
-            self._emit("done")
-            return None
-        return key
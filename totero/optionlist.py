@@ -7,12 +7,12 @@
 # Distributed under terms of the BSD 3-Clause license.
 
 """A window for options used for sorting."""
+from itertools import compress as _compress
 from typing import Sequence as _Sequence
 from typing import List as _List
 from typing import Union as _Union
 from typing import Any as _Any
 from urwid import AttrMap as _AttrMap
-from urwid import ListBox as _ListBox
 from urwid import SimpleFocusListWalker as _SimpleFocusListWalker
 from urwid import Text as _Text
 from urwid import Columns as _Columns
@@ -22,6 +22,7 @@ from urwid import LineBox as _LineBox
 from urwid import connect_signal as _connect_signal
 from .misc import DoneButton as _DoneButton
 from .misc import CancelButton as _CancelButton
+from .misc import CachingListBox as _CachingListBox
 
 
 class OptionItem(_AttrMap):
@@ -53,6 +54,9 @@ class OptionItem(_AttrMap):
        `_focus_ctagg` to change the color tag.
     """
 
+    # slots for the per-option attributes; cuts per-instance memory in large option lists
+    __slots__ = ("_tag", "_state", "_rendered", "_txt_cache")
+
     # default color tags in palette
     _norm_ctag = "opt item normal"
     _focus_ctag = "opt item focus"
@@ -66,8 +70,16 @@ class OptionItem(_AttrMap):
         self._tag = tag
         self._state = state
 
-        # underlying widget
-        txt = _Text("[{}] {}".format(self._marker[self._state], self._tag), wrap=wrap)
+        # both possible display strings, built once; state flips then index this pair instead
+        # of running str.format on every toggle
+        self._txt_cache = (
+            "[{}] {}".format(self._marker[False], tag),
+            "[{}] {}".format(self._marker[True], tag),
+        )
+
+        # underlying widget; remember the string put into the Text to skip no-op updates later
+        self._rendered = self._txt_cache[state]
+        txt = _Text(self._rendered, wrap=wrap)
         txt.ignore_focus = False
         txt._selectable = True
         super().__init__(txt, self._norm_ctag, self._focus_ctag)
@@ -104,7 +116,13 @@ class OptionItem(_AttrMap):
 
     def _invalidate(self):
         """Override _invalidate."""
-        self.original_widget.set_text("[{}] {}".format(self._marker[self._state], self._tag))
+        # `set_text` discards the Text's layout cache and cascades a re-render up the tree, so
+        # it is only called when the visible string actually changed; `_invalidate` may fire
+        # for reasons unrelated to the state (e.g. focus changes)
+        new = self._txt_cache[self._state]
+        if new is not self._rendered:
+            self._rendered = new
+            self.original_widget.set_text(new)
         super()._invalidate()
 
 
@@ -156,16 +174,19 @@ class OptionList(_AttrMap):
         title: str = "", wrap: str = "clip"
     ):
 
-        # initialize _SimpleFocusListWalker; it is actually a list-like object
-        try:
-            self._options = _SimpleFocusListWalker(
-                [OptionItem(opt, state, wrap) for opt, state in zip(options, states)])
-        except TypeError:
-            self._options = _SimpleFocusListWalker(
-                [OptionItem(opt, states, wrap) for opt in options])
+        # initialize _SimpleFocusListWalker; it is actually a list-like object. An explicit
+        # isinstance test dispatches the scalar-vs-sequence forms of `states`; the former
+        # try/except TypeError probe would also swallow a TypeError raised inside the
+        # OptionItem constructor and silently fall back to the scalar branch
+        if isinstance(states, bool):
+            items = [OptionItem(opt, states, wrap) for opt in options]
+        else:
+            items = [OptionItem(opt, state, wrap) for opt, state in zip(options, states)]
+        self._options = _SimpleFocusListWalker(items)
 
-        # the initial states of all options
-        self._current_state = [opt.state for opt in self._options]
+        # the initial states of all options, packed into one int: bit i is option i's state;
+        # a single machine-word-ish object instead of a list of N bool PyObjects
+        self._current_state = self._snapshot_states()
 
         # cancel and done (confirm) button
         self._buttons = _Columns([_CancelButton(), _DoneButton()])
@@ -174,7 +195,7 @@ class OptionList(_AttrMap):
 
         super().__init__(
             _LineBox(
-                _Pile([_ListBox(self._options), (3, _Filler(self._buttons))]),
+                _Pile([_CachingListBox(self._options), (3, _Filler(self._buttons))]),
                 title, "left", self._title_ctag
             ),
             self._border_ctag
@@ -189,20 +210,28 @@ class OptionList(_AttrMap):
     @property
     def selected(self) -> _List[str]:
         """Get the content of all selected options."""
-        tags = []
-        for state, widget in zip(self._current_state, self._options):
-            if state:
-                tags.append(widget.tag)
-        return tags
+        # compress filters in C against the unpacked mask bits, instead of a Python-level
+        # branch per option
+        mask = self._current_state
+        bits = ((mask >> i) & 1 for i in range(len(self._options)))
+        return [widget.tag for widget in _compress(self._options, bits)]
+
+    def _snapshot_states(self) -> int:
+        """Pack the current states of all options into an int bitmask."""
+        return sum(1 << i for i, opt in enumerate(self._options) if opt.state)
 
     def _cancel(self, event: _Any):  # pylint: disable=unused-argument
         """Process cancel signal."""
-        # if canceled, restore the original states
-        for state, widget in zip(self._current_state, self._options):
-            widget.state = state
+        # if canceled, restore the original states; only the options the user actually toggled
+        # get written back, so only those rows pay for an invalidation/re-render
+        mask = self._current_state
+        for i, widget in enumerate(self._options):
+            saved = bool((mask >> i) & 1)
+            if widget.state != saved:
+                widget.state = saved
         self._emit("close")
 
     def _done(self, event: _Any):  # pylint: disable=unused-argument
         """Process done signal."""
-        self._current_state = [opt.state for opt in self._options]
+        self._current_state = self._snapshot_states()
         self._emit("close")